@@ -25,6 +25,9 @@ from .benchmarks import create_circuit
 from .targets.gatesets import get_target_for_gateset, ionq, rigetti
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from qiskit.circuit import EquivalenceLibrary
     from qiskit.transpiler import Target
 
 
@@ -143,6 +146,31 @@ def _create_mirror_circuit(
     return target_qc
 
 
+# Vendors whose targets require custom gate equivalences, checked in this order against the target description
+_EQUIVALENCE_ADDERS: dict[str, Callable[[EquivalenceLibrary], None]] = {
+    "rigetti": rigetti.add_equivalences,
+    "ionq": ionq.add_equivalences,
+}
+_ADDED_EQUIVALENCES: set[str] = set()
+
+
+def _add_equivalences(target: Target) -> None:
+    """Add the custom gate equivalences required by the target to the session equivalence library.
+
+    The equivalences of each vendor are only added once per session, as adding them again would duplicate the
+    entries in the library.
+
+    Arguments:
+        target: Target the benchmark is compiled for.
+    """
+    vendor = next((vendor for vendor in _EQUIVALENCE_ADDERS if vendor in target.description), None)
+    if vendor is None or vendor in _ADDED_EQUIVALENCES:
+        return
+
+    _EQUIVALENCE_ADDERS[vendor](SessionEquivalenceLibrary)
+    _ADDED_EQUIVALENCES.add(vendor)
+
+
 def _validate_opt_level(opt_level: int) -> None:
     """Validate optimization level.
 
@@ -317,10 +345,7 @@ def get_benchmark_native_gates(
         circuit = pm.run(compiled_for_sk.remove_final_measurements(inplace=False))
         circuit.measure_all()
 
-    if "rigetti" in target.description:
-        rigetti.add_equivalences(SessionEquivalenceLibrary)
-    elif "ionq" in target.description:
-        ionq.add_equivalences(SessionEquivalenceLibrary)
+    _add_equivalences(target)
     pm = generate_preset_pass_manager(optimization_level=opt_level, target=target, seed_transpiler=10)
     pm.layout = None
     pm.routing = None
@@ -382,10 +407,7 @@ def get_benchmark_mapped(
 
     circuit = _get_circuit(benchmark, circuit_size, random_parameters)
 
-    if "rigetti" in target.description:
-        rigetti.add_equivalences(SessionEquivalenceLibrary)
-    elif "ionq" in target.description:
-        ionq.add_equivalences(SessionEquivalenceLibrary)
+    _add_equivalences(target)
 
     mapped_circuit = transpile(
         circuit,
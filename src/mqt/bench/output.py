@@ -10,6 +10,7 @@
 
 from __future__ import annotations
 
+import logging
 from datetime import date
 from enum import Enum
 from importlib import metadata
@@ -30,6 +31,8 @@ if TYPE_CHECKING:  # pragma: no cover
     from qiskit.circuit import QuantumCircuit
     from qiskit.transpiler import Target
 
+logger = logging.getLogger(__name__)
+
 
 class OutputFormat(str, Enum):
     """Enumeration of supported output formats for circuit export."""
@@ -222,8 +225,8 @@ def save_circuit(
     path = Path(target_directory) / f"{filename}.{output_format.extension()}"
     try:
         write_circuit(qc, path, level, output_format, target)
-    except MQTBenchExporterError as e:
-        print(e)
+    except MQTBenchExporterError:
+        logger.exception("Failed to save the circuit to %s.", path)
         return False
 
     return True
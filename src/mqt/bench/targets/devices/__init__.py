@@ -23,12 +23,6 @@ if TYPE_CHECKING:
 
     from qiskit.transpiler import Target
 
-_DISCOVERED_MODULES: set[str] = {
-    path.stem
-    for entry in ir.files(__package__).iterdir()
-    if (path := cast("Path", entry)).is_file() and path.suffix == ".py" and not path.stem.startswith("_")
-}
-
 _IMPORTED_MODULES: set[str] = set()
 
 __all__ = [
@@ -38,6 +32,19 @@ __all__ = [
 ]
 
 
+@cache
+def _discovered_modules() -> frozenset[str]:
+    """Return the names of all device modules in this package.
+
+    The package directory is scanned on first use instead of at import time.
+    """
+    return frozenset(
+        path.stem
+        for entry in ir.files(__package__).iterdir()
+        if (path := cast("Path", entry)).is_file() and path.suffix == ".py" and not path.stem.startswith("_")
+    )
+
+
 def _module_from_device_name(device_name: str) -> str:
     """Return the module filename that should contain device_name.
 
@@ -54,8 +61,8 @@ def _ensure_loaded(device_name: str) -> None:
         return  # already registered
 
     module_name = _module_from_device_name(device_name)
-    if module_name not in _DISCOVERED_MODULES:
-        msg = f"'{device_name}' is not a supported device. Known modules: {sorted(_DISCOVERED_MODULES)}"
+    if module_name not in _discovered_modules():
+        msg = f"'{device_name}' is not a supported device. Known modules: {sorted(_discovered_modules())}"
         raise ValueError(msg)
 
     if module_name not in _IMPORTED_MODULES:
@@ -68,7 +75,7 @@ def get_available_device_names() -> list[str]:
 
     To guarantee completeness we import every not-yet-imported module once.
     """
-    for module in _DISCOVERED_MODULES - _IMPORTED_MODULES:
+    for module in _discovered_modules() - _IMPORTED_MODULES:
         importlib.import_module(f"{__package__}.{module}")
         _IMPORTED_MODULES.add(module)
 
@@ -87,5 +94,10 @@ def _get_device(device_name: str) -> Target:
 
 
 def get_device(device_name: str) -> Target:
-    """Return a deepcopy of the requested qiskit ``Target`` device."""
+    """Return a deepcopy of the requested qiskit ``Target`` device.
+
+    Devices with uniform calibration data share one ``InstructionProperties`` object between all qubits or edges of
+    an operation. Use ``Target.update_instruction_properties`` to change the properties of a single qubit or edge
+    instead of mutating the returned properties in place.
+    """
     return copy.deepcopy(_get_device(device_name))
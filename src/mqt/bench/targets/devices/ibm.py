@@ -20,12 +20,10 @@ if TYPE_CHECKING:
 
 from qiskit.providers.fake_provider import GenericBackendV2
 
-from ..gatesets import get_gateset
+from ..gatesets import DEFAULT_SEED, get_gateset
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_SEED = 42
-
 
 @register_device("ibm_falcon_27")
 def get_ibm_falcon_27() -> Target:
@@ -10,6 +10,8 @@
 
 from __future__ import annotations
 
+from itertools import permutations
+
 from qiskit.circuit import Parameter
 from qiskit.circuit.library import Measure, RZGate
 from qiskit.transpiler import InstructionProperties, Target
@@ -17,6 +19,12 @@ from qiskit.transpiler import InstructionProperties, Target
 from ..gatesets.ionq import GPI2Gate, GPIGate, MSGate, ZZGate
 from ._registry import register_device
 
+_THETA = Parameter("theta")
+_PHI = Parameter("phi")
+_ALPHA = Parameter("alpha")
+_BETA = Parameter("beta")
+_GAMMA = Parameter("gamma")
+
 
 @register_device("ionq_aria_25")
 def get_ionq_aria_25() -> Target:
@@ -67,37 +75,27 @@ def _build_ionq_target(
     """Construct a hardcoded IonQ target using mean values."""
     target = Target(num_qubits=num_qubits, description=description)
 
-    theta = Parameter("theta")
-    phi = Parameter("phi")
-
     # === Add single-qubit gates ===
-    singleq_props = {
-        (q,): InstructionProperties(duration=oneq_duration, error=1 - oneq_fidelity) for q in range(num_qubits)
-    }
-    rz_props = {(q,): InstructionProperties(duration=0, error=0) for q in range(num_qubits)}
-    measure_props = {
-        (q,): InstructionProperties(duration=readout_duration, error=1 - spam_fidelity) for q in range(num_qubits)
-    }
-
-    target.add_instruction(RZGate(theta), rz_props)
-    target.add_instruction(GPIGate(theta), singleq_props)
-    target.add_instruction(GPI2Gate(phi), singleq_props)
+    qubits = [(q,) for q in range(num_qubits)]
+    singleq_props = dict.fromkeys(qubits, InstructionProperties(duration=oneq_duration, error=1 - oneq_fidelity))
+    rz_props = dict.fromkeys(qubits, InstructionProperties(duration=0, error=0))
+    measure_props = dict.fromkeys(qubits, InstructionProperties(duration=readout_duration, error=1 - spam_fidelity))
+
+    target.add_instruction(RZGate(_THETA), rz_props)
+    target.add_instruction(GPIGate(_THETA), singleq_props)
+    target.add_instruction(GPI2Gate(_PHI), singleq_props)
     target.add_instruction(Measure(), measure_props)
 
     # === Add two-qubit gates ===
-    connectivity = [(i, j) for i in range(num_qubits) for j in range(num_qubits) if i != j]
-    twoq_props = {
-        (q1, q2): InstructionProperties(duration=twoq_duration, error=1 - twoq_fidelity) for q1, q2 in connectivity
-    }
+    # All-to-all connectivity with uniform calibration data, so every pair shares one properties object.
+    twoq_props = dict.fromkeys(
+        permutations(range(num_qubits), 2), InstructionProperties(duration=twoq_duration, error=1 - twoq_fidelity)
+    )
 
     if entangling_gate == "MS":
-        alpha = Parameter("alpha")
-        beta = Parameter("beta")
-        gamma = Parameter("gamma")
-        target.add_instruction(MSGate(alpha, beta, gamma), twoq_props)
+        target.add_instruction(MSGate(_ALPHA, _BETA, _GAMMA), twoq_props)
     elif entangling_gate == "ZZ":
-        alpha = Parameter("alpha")
-        target.add_instruction(ZZGate(alpha), twoq_props)
+        target.add_instruction(ZZGate(_ALPHA), twoq_props)
     else:
         msg = f"Unknown entangling gate: '{entangling_gate}'."
         raise ValueError(msg)
@@ -10,12 +10,18 @@
 
 from __future__ import annotations
 
+from itertools import permutations
+
 from qiskit.circuit import Parameter
 from qiskit.circuit.library import Measure, RXGate, RYGate, RZGate, RZZGate
 from qiskit.transpiler import InstructionProperties, Target
 
 from ._registry import register_device
 
+_THETA = Parameter("theta")
+_PHI = Parameter("phi")
+_ALPHA = Parameter("alpha")
+
 
 @register_device("quantinuum_h2_56")
 def get_quantinuum_h2_56() -> Target:
@@ -41,23 +47,18 @@ def _build_quantinuum_target(
     """Construct a hardcoded Quantinuum target using mean values."""
     target = Target(num_qubits=num_qubits, description=name)
 
-    # Define symbolic parameters
-    theta = Parameter("theta")
-    phi = Parameter("phi")
-    alpha = Parameter("alpha")
-
     # === Add single-qubit gates ===
-    single_qubit_gate_props = {(q,): InstructionProperties(error=oneq_error) for q in range(num_qubits)}
-    measure_props = {(q,): InstructionProperties(error=spam_error) for q in range(num_qubits)}
+    qubits = [(q,) for q in range(num_qubits)]
+    single_qubit_gate_props = dict.fromkeys(qubits, InstructionProperties(error=oneq_error))
+    measure_props = dict.fromkeys(qubits, InstructionProperties(error=spam_error))
 
-    target.add_instruction(RXGate(theta), single_qubit_gate_props)
-    target.add_instruction(RYGate(phi), single_qubit_gate_props)
-    target.add_instruction(RZGate(theta), single_qubit_gate_props)
+    target.add_instruction(RXGate(_THETA), single_qubit_gate_props)
+    target.add_instruction(RYGate(_PHI), single_qubit_gate_props)
+    target.add_instruction(RZGate(_THETA), single_qubit_gate_props)
     target.add_instruction(Measure(), measure_props)
 
     # === Add two-qubit RZZ gates ===
-    connectivity = [(i, j) for i in range(num_qubits) for j in range(num_qubits) if i != j]
-    rzz_props = {(q1, q2): InstructionProperties(error=twoq_error) for q1, q2 in connectivity}
-    target.add_instruction(RZZGate(alpha), rzz_props)
+    rzz_props = dict.fromkeys(permutations(range(num_qubits), 2), InstructionProperties(error=twoq_error))
+    target.add_instruction(RZZGate(_ALPHA), rzz_props)
 
     return target
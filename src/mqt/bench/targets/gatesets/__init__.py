@@ -10,7 +10,6 @@
 
 from __future__ import annotations
 
-import copy
 import importlib
 import importlib.resources as ir
 from functools import cache
@@ -18,22 +17,16 @@ from typing import TYPE_CHECKING, cast
 
 from qiskit.circuit import Parameter
 from qiskit.circuit.library.standard_gates import get_standard_gate_name_mapping
-from qiskit.providers.fake_provider import GenericBackendV2
 
 from ._registry import gateset_names, get_gateset_by_name, register_gateset
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
     from qiskit.circuit import Gate
     from qiskit.transpiler import Target
 
-_DISCOVERED_MODULES: set[str] = {
-    path.stem
-    for entry in ir.files(__package__).iterdir()
-    if (path := cast("Path", entry)).is_file() and path.suffix == ".py" and not path.stem.startswith("_")
-}
-
 _IMPORTED_MODULES: set[str] = set()
 
 __all__ = [
@@ -43,6 +36,23 @@ __all__ = [
     "register_gateset",
 ]
 
+# Seed for the calibration data generated by ``GenericBackendV2``, shared with the IBM devices.
+DEFAULT_SEED = 42
+
+
+@cache
+def _discovered_modules() -> frozenset[str]:
+    """Return the names of all gateset modules in this package.
+
+    The package directory is scanned on first use instead of at import time.
+    """
+    return frozenset(
+        path.stem
+        for entry in ir.files(__package__).iterdir()
+        if (path := cast("Path", entry)).is_file() and path.suffix == ".py" and not path.stem.startswith("_")
+    )
+
+
 _SPECIAL_NAME_TO_MODULE = {
     "clifford+t": "clifford_t",
     "clifford+t+rotations": "clifford_t",
@@ -69,8 +79,8 @@ def _ensure_loaded(gateset_name: str) -> None:
 
     module_name = _module_from_gateset_name(gateset_name)
 
-    if module_name not in _DISCOVERED_MODULES:
-        msg = f"'{gateset_name}' is not a supported gateset. Known modules: {sorted(_DISCOVERED_MODULES)}"
+    if module_name not in _discovered_modules():
+        msg = f"'{gateset_name}' is not a supported gateset. Known modules: {sorted(_discovered_modules())}"
         raise ValueError(msg)
 
     if module_name not in _IMPORTED_MODULES:
@@ -80,7 +90,7 @@ def _ensure_loaded(gateset_name: str) -> None:
 
 def get_available_gateset_names() -> list[str]:
     """Return a list of available gateset names."""
-    for module in _DISCOVERED_MODULES - _IMPORTED_MODULES:
+    for module in _discovered_modules() - _IMPORTED_MODULES:
         importlib.import_module(f"{__package__}.{module}")
         _IMPORTED_MODULES.add(module)
 
@@ -99,8 +109,9 @@ def get_gateset(gateset_name: str) -> list[str]:
     return _get_gateset(gateset_name).copy()
 
 
-def _lazy_custom_gates() -> dict[str, Gate]:
-    """Import custom gates only when needed."""
+@cache
+def _lazy_custom_gates() -> dict[str, Callable[[], Gate]]:
+    """Import custom gates only when needed and return a builder for each of them."""
     from .ionq import GPI2Gate, GPIGate, MSGate, ZZGate  # noqa: PLC0415
     from .rigetti import RXPI2DgGate, RXPI2Gate, RXPIGate  # noqa: PLC0415
 
@@ -116,31 +127,48 @@ def _lazy_custom_gates() -> dict[str, Gate]:
 
 
 @cache
-def _get_target_for_gateset(gateset_name: str, num_qubits: int) -> Target:
-    """Return the Target object for a given native gateset name."""
-    gates = get_gateset(gateset_name)
-
-    standard_gates = []
-    other_gates = []
-    for gate in gates:
-        if gate in get_standard_gate_name_mapping():
-            standard_gates.append(gate)
-        else:
-            other_gates.append(gate)
-    backend = GenericBackendV2(num_qubits=num_qubits, basis_gates=standard_gates)
+def _standard_gate_names() -> frozenset[str]:
+    """Return the names of Qiskit's standard gates.
+
+    ``get_standard_gate_name_mapping`` instantiates every standard gate on each call, so the names are computed once.
+    """
+    return frozenset(get_standard_gate_name_mapping())
+
+
+@cache
+def _get_gateset_partition(gateset_name: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Split a gateset into Qiskit standard gates and custom gates."""
+    gates = _get_gateset(gateset_name)
+    standard_names = _standard_gate_names()
+    standard_gates = tuple(gate for gate in gates if gate in standard_names)
+    other_gates = tuple(gate for gate in gates if gate not in standard_names)
+    return standard_gates, other_gates
+
+
+def _build_target_for_gateset(gateset_name: str, num_qubits: int) -> Target:
+    """Build a new Target object for a given native gateset name."""
+    from qiskit.providers.fake_provider import GenericBackendV2  # noqa: PLC0415
+
+    standard_gates, other_gates = _get_gateset_partition(gateset_name)
+    backend = GenericBackendV2(num_qubits=num_qubits, basis_gates=list(standard_gates), seed=DEFAULT_SEED)
     target = backend.target
     target.description = gateset_name
 
     custom_factory = _lazy_custom_gates()
     for gate_name in other_gates:
-        if gate_name not in custom_factory:
+        builder = custom_factory.get(gate_name)
+        if builder is None:
             msg = f"Gate '{gate_name}' not found in available custom gates."
             raise ValueError(msg)
-        target.add_instruction(custom_factory[gate_name]())
+        target.add_instruction(builder())
 
     return target
 
 
 def get_target_for_gateset(name: str, num_qubits: int) -> Target:
-    """Return a deepcopy of a Target object for a given native gateset name."""
-    return copy.deepcopy(_get_target_for_gateset(name, num_qubits))
+    """Return a new Target object for a given native gateset name.
+
+    Every call builds a fresh Target whose calibration data is generated with the fixed ``DEFAULT_SEED``, so repeated
+    calls return independent but equal targets.
+    """
+    return _build_target_for_gateset(name, num_qubits)
@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING, NoReturn, cast
 
 import pytest
 from qiskit import QuantumCircuit, qpy
-from qiskit.circuit import Parameter
+from qiskit.circuit import Parameter, SessionEquivalenceLibrary
 from qiskit.circuit.library import CXGate, HGate, RXGate, RZGate, XGate
 from qiskit.compiler import transpile
 from qiskit.transpiler import (
@@ -423,6 +423,17 @@ def test_clifford_t() -> None:
     assert pm.property_set["all_gates_in_basis"]
 
 
+def test_equivalences_added_once() -> None:
+    """Vendor equivalences must only be added to the session equivalence library once."""
+    target = get_target_for_gateset("ionq_forte", num_qubits=3)
+    get_benchmark_native_gates("ghz", 3, target)
+    num_entries = len(SessionEquivalenceLibrary.get_entry(CXGate()))
+
+    get_benchmark_native_gates("ghz", 3, target)
+    get_benchmark_mapped("ghz", 3, get_device("ionq_forte_36"))
+    assert len(SessionEquivalenceLibrary.get_entry(CXGate())) == num_entries
+
+
 def test_benchmark_helper_shor() -> None:
     """Testing the Shor benchmarks."""
     shor_instances = ["xsmall", "small", "medium", "large", "xlarge"]
@@ -681,8 +692,10 @@ def test_save_circuit_success(tmp_path: Path) -> None:
     assert (tmp_path / "bar.qpy").exists()
 
 
-def test_save_circuit_write_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    """save_circuit returns False when write_circuit fails."""
+def test_save_circuit_write_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """save_circuit returns False and logs the error when write_circuit fails."""
     qc = QuantumCircuit(1)
     qc.h(0)
 
@@ -693,6 +706,7 @@ def test_save_circuit_write_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatc
 
     ok = save_circuit(qc, "baz", BenchmarkLevel.INDEP, OutputFormat.QASM3, target_directory=str(tmp_path))
     assert ok is False
+    assert "boom" in caplog.text
 
 
 @pytest.mark.parametrize("fmt", [OutputFormat.QASM2, OutputFormat.QASM3])
@@ -11,11 +11,13 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
-from qiskit.transpiler import Target
+from qiskit.transpiler import InstructionProperties, Target
 
 from mqt.bench.targets.devices import (
     _module_from_device_name,  # noqa: PLC2701
@@ -32,7 +34,7 @@ from mqt.bench.targets.gatesets import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterable, Mapping, Sequence
 
 
 @dataclass(frozen=True)
@@ -41,112 +43,191 @@ class DeviceSpec:
 
     name: str
     num_qubits: int
-    single_qubit_gates: set[str] = field(default_factory=set)
-    two_qubit_gates: set[str] = field(default_factory=set)
-    # If *symmetric_connectivity* is *True*, require (q1, q0) whenever (q0, q1)
-    symmetric_connectivity: Mapping[str, bool] = field(default_factory=dict)
+    single_qubit_gates: frozenset[str] = frozenset()
+    two_qubit_gates: frozenset[str] = frozenset()
+    # (gate, flag) items; if the flag is *True*, require (q1, q0) whenever (q0, q1)
+    symmetric_connectivity: frozenset[tuple[str, bool]] = frozenset()
 
-    def __post_init__(self) -> None:  # pragma: no cover
+    def __post_init__(self) -> None:
         """Ensures that all declared two-qubit gates have an associated symmetry flag."""
-        # Ensure symmetry flags are defined for all declared 2-qubit gates
-        missing = self.two_qubit_gates.difference(self.symmetric_connectivity)
+        missing = self.two_qubit_gates - dict(self.symmetric_connectivity).keys()
         if missing:
-            object.__setattr__(
-                self, "symmetric_connectivity", {**self.symmetric_connectivity, **dict.fromkeys(missing, False)}
-            )
+            msg = f"{self.name}: no symmetry flag for two-qubit gates {sorted(missing)}, use DeviceSpec.make."
+            raise ValueError(msg)
+
+    @cached_property
+    def two_qubit_plan(self) -> tuple[tuple[str, bool], ...]:
+        """(gate, symmetric) pairs of all two-qubit gates, in the order in which they are checked."""
+        flags = dict(self.symmetric_connectivity)
+        return tuple((gate, flags[gate]) for gate in sorted(self.two_qubit_gates))
+
+    @classmethod
+    def make(
+        cls,
+        *,
+        name: str,
+        num_qubits: int,
+        single_qubit_gates: Iterable[str] = (),
+        two_qubit_gates: Iterable[str] = (),
+        symmetric_connectivity: Mapping[str, bool] | None = None,
+    ) -> DeviceSpec:
+        """Create a spec whose symmetry flags cover all declared two-qubit gates (defaulting to *False*)."""
+        two_qubit_gates = frozenset(two_qubit_gates)
+        flags = dict.fromkeys(two_qubit_gates, False) | dict(symmetric_connectivity or {})
+        return cls(
+            name=name,
+            num_qubits=num_qubits,
+            single_qubit_gates=frozenset(single_qubit_gates),
+            two_qubit_gates=two_qubit_gates,
+            symmetric_connectivity=frozenset(flags.items()),
+        )
+
+
+@pytest.fixture(scope="session")
+def device_cache() -> dict[str, Target]:
+    """Session-wide cache so that every device is only retrieved once."""
+    return {}
+
+
+def _get_cached_device(device_name: str, cache: dict[str, Target]) -> Target:
+    """Return the device from *cache*, retrieving it on first access."""
+    if device_name not in cache:
+        cache[device_name] = get_device(device_name)
+    return cache[device_name]
+
+
+@pytest.fixture
+def target(request: pytest.FixtureRequest, device_cache: dict[str, Target]) -> Target:
+    """Device described by the indirectly parametrized :class:`DeviceSpec`."""
+    return _get_cached_device(request.param.name, device_cache)
+
+
+def _property_columns(
+    insts: Mapping[tuple[int, ...], InstructionProperties | None],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the error rates and durations of *insts* as separate arrays.
+
+    Missing properties or error rates are stored as NaN, which fails every range check. Durations are optional, so
+    whether a duration is set is returned as a separate boolean mask, which keeps a missing duration distinguishable
+    from a NaN one.
+    """
+    values = list(insts.values())
+    errors = np.fromiter(
+        (np.nan if props is None or props.error is None else props.error for props in values),
+        dtype=np.float64,
+        count=len(values),
+    )
+    has_duration = np.fromiter(
+        (props is not None and props.duration is not None for props in values), dtype=np.bool_, count=len(values)
+    )
+    durations = np.fromiter(
+        (props.duration if props is not None and props.duration is not None else np.nan for props in values),
+        dtype=np.float64,
+        count=len(values),
+    )
+    return errors, durations, has_duration
+
+
+def _properties_in_range(
+    insts: Mapping[tuple[int, ...], InstructionProperties | None], *, positive_duration: bool
+) -> np.ndarray:
+    """Return a mask of the entries of *insts* whose error rate and duration are valid, in one vectorized pass.
+
+    Missing or NaN error rates and NaN durations are invalid, whereas missing durations are ignored.
+    """
+    errors, durations, has_duration = _property_columns(insts)
+    durations_ok = (durations > 0) if positive_duration else (durations >= 0)
+    return (errors >= 0) & (errors < 1) & (~has_duration | durations_ok)
 
 
-def _assert_single_qubit_gate_properties(target: Target, gate_name: str, *, vendor: str) -> None:
-    if gate_name not in target.operation_names:
+def _report_out_of_range(
+    insts: Mapping[tuple[int, ...], InstructionProperties | None], *, what: str, positive_duration: bool
+) -> None:
+    """Fail with the offending qubits if any entry of *insts* has missing or out-of-range properties."""
+    in_range = _properties_in_range(insts, positive_duration=positive_duration)
+    if in_range.all():
+        return
+    qargs = list(insts)
+    offending = {qargs[i]: insts[qargs[i]] for i in np.flatnonzero(~in_range)}
+    pytest.fail(f"{what}: missing or out-of-range properties (error in [0,1), valid duration) on {offending}")
+
+
+def _assert_single_qubit_gate_properties(
+    target: Target, gate_name: str, *, present: frozenset[str], vendor: str
+) -> None:
+    if gate_name not in present:
         pytest.fail(f"{vendor}: expected single-qubit gate '{gate_name}' not found in target.operations")
 
-    for (qubit,) in target[gate_name]:
-        props = target[gate_name][qubit,]
-        assert props is not None, f"{vendor}: props for '{gate_name}' on qubit {qubit} missing"
-        dur = getattr(props, "duration", None)
-        if dur is not None:
-            assert dur >= 0, f"{vendor}: negative duration for '{gate_name}' on qubit {qubit}"
-        err = getattr(props, "error", None)
-        assert err is not None, f"{vendor}: error rate for '{gate_name}' on qubit {qubit} missing"
-        assert 0 <= err < 1, f"{vendor}: error outside [0,1) for '{gate_name}' on qubit {qubit}"
+    _report_out_of_range(target[gate_name], what=f"{vendor}: '{gate_name}'", positive_duration=False)
 
 
-def _assert_two_qubit_gate_properties(target: Target, gate_name: str, *, symmetric: bool, vendor: str) -> None:
-    if gate_name not in target.operation_names:
+def _assert_two_qubit_gate_properties(
+    target: Target, gate_name: str, *, present: frozenset[str], symmetric: bool, vendor: str
+) -> None:
+    if gate_name not in present:
         pytest.fail(f"{vendor}: expected two-qubit gate '{gate_name}' not found in target.operations")
 
-    for (q0, q1), props in target[gate_name].items():
+    insts = target[gate_name]
+    pairs = frozenset(insts)
+    for q0, q1 in pairs:
         assert q0 != q1, f"{vendor}: identical qubits for '{gate_name}' connection ({q0}, {q1})"
-        assert props is not None, f"{vendor}: props for '{gate_name}' on ({q0}, {q1}) missing"
-        dur = getattr(props, "duration", None)
-        if dur is not None:
-            assert dur > 0, f"{vendor}: non-positive duration for '{gate_name}' on ({q0}, {q1})"
-        err = getattr(props, "error", None)
-        assert err is not None, f"{vendor}: error rate for '{gate_name}' on ({q0}, {q1}) missing"
-        assert 0 <= err < 1, f"{vendor}: error outside [0,1) for '{gate_name}' on ({q0}, {q1})"
-        if symmetric:
-            assert (
-                q1,
-                q0,
-            ) in target[gate_name], f"{vendor}: missing symmetric connection ({q1}, {q0}) for '{gate_name}'"
-
-
-def _assert_measure_properties(target: Target, *, vendor: str) -> None:
-    if "measure" not in target.operation_names:
+    if symmetric:
+        reversed_pairs = {(q1, q0) for q0, q1 in pairs}
+        assert pairs == reversed_pairs, (
+            f"{vendor}: missing symmetric connections {sorted(reversed_pairs - pairs)} for '{gate_name}'"
+        )
+
+    _report_out_of_range(insts, what=f"{vendor}: '{gate_name}'", positive_duration=True)
+
+
+def _assert_measure_properties(target: Target, *, present: frozenset[str], vendor: str) -> None:
+    if "measure" not in present:
         pytest.fail(f"{vendor}: missing mandatory 'measure' operation")
 
-    for (qubit,) in target["measure"]:
-        props = target["measure"][qubit,]
-        assert props is not None, f"{vendor}: measure props missing for qubit {qubit}"
-        dur = getattr(props, "duration", None)
-        if dur is not None:
-            assert dur > 0, f"{vendor}: non-positive measure duration on qubit {qubit}"
-        err = getattr(props, "error", None)
-        assert err is not None, f"{vendor}: error rate for qubit {qubit} missing"
-        assert 0 <= err < 1, f"{vendor}: measure error outside [0,1) on qubit {qubit}"
+    _report_out_of_range(target["measure"], what=f"{vendor}: 'measure'", positive_duration=True)
 
 
 DEVICE_SPECS: Sequence[DeviceSpec] = [
     # ─────────────────────────────────────────────────────────────────── IBM ──
-    DeviceSpec(
+    DeviceSpec.make(
         name="ibm_falcon_27",
         num_qubits=27,
         single_qubit_gates={"sx", "rz", "x", "measure"},
         two_qubit_gates={"cx"},
     ),
-    DeviceSpec(
+    DeviceSpec.make(
         name="ibm_falcon_127",
         num_qubits=127,
         single_qubit_gates={"sx", "rz", "x", "measure"},
         two_qubit_gates={"cx"},
     ),
-    DeviceSpec(
+    DeviceSpec.make(
         name="ibm_eagle_127",
         num_qubits=127,
         single_qubit_gates={"sx", "rz", "x", "measure"},
         two_qubit_gates={"ecr"},
     ),
-    DeviceSpec(
+    DeviceSpec.make(
         name="ibm_heron_133",
         num_qubits=133,
         single_qubit_gates={"sx", "rz", "x", "measure"},
         two_qubit_gates={"cz"},
     ),
-    DeviceSpec(
+    DeviceSpec.make(
         name="ibm_heron_156",
         num_qubits=156,
         single_qubit_gates={"sx", "rz", "x", "measure"},
         two_qubit_gates={"cz"},
     ),
     # ────────────────────────────────────────────────────────────────── IonQ ──
-    DeviceSpec(
+    DeviceSpec.make(
         name="ionq_aria_25",
         num_qubits=25,
         single_qubit_gates={"gpi", "gpi2", "measure"},
         two_qubit_gates={"ms"},
         symmetric_connectivity={"ms": True},
     ),
-    DeviceSpec(
+    DeviceSpec.make(
         name="ionq_forte_36",
         num_qubits=36,
         single_qubit_gates={"gpi", "gpi2", "measure"},
@@ -154,27 +235,27 @@ DEVICE_SPECS: Sequence[DeviceSpec] = [
         symmetric_connectivity={"zz": True},
     ),
     # ─────────────────────────────────────────────────────────────────── IQM ──
-    DeviceSpec(
+    DeviceSpec.make(
         name="iqm_crystal_5",
         num_qubits=5,
         single_qubit_gates={"r", "measure"},
         two_qubit_gates={"cz"},
         symmetric_connectivity={"cz": True},
     ),
-    DeviceSpec(
+    DeviceSpec.make(
         name="iqm_crystal_20",
         num_qubits=20,
         single_qubit_gates={"r", "measure"},
         two_qubit_gates={"cz"},
     ),
-    DeviceSpec(
+    DeviceSpec.make(
         name="iqm_crystal_54",
         num_qubits=54,
         single_qubit_gates={"r", "measure"},
         two_qubit_gates={"cz"},
     ),
     # ────────────────────────────────────────────────────────────── Quantinuum ──
-    DeviceSpec(
+    DeviceSpec.make(
         name="quantinuum_h2_56",
         num_qubits=56,
         single_qubit_gates={"rx", "ry", "rz", "measure"},
@@ -182,7 +263,7 @@ DEVICE_SPECS: Sequence[DeviceSpec] = [
         symmetric_connectivity={"rzz": True},
     ),
     # ─────────────────────────────────────────────────────────────── Rigetti ──
-    DeviceSpec(
+    DeviceSpec.make(
         name="rigetti_ankaa_84",
         num_qubits=84,
         single_qubit_gates={"rxpi", "rxpi2", "rxpi2dg", "rz", "measure"},
@@ -191,31 +272,30 @@ DEVICE_SPECS: Sequence[DeviceSpec] = [
 ]
 
 
-@pytest.mark.parametrize("spec", DEVICE_SPECS, ids=[d.name for d in DEVICE_SPECS])
-def test_device_spec(spec: DeviceSpec) -> None:
+@pytest.mark.parametrize(
+    ("spec", "target"),
+    [(spec, spec) for spec in DEVICE_SPECS],
+    ids=[d.name for d in DEVICE_SPECS],
+    indirect=["target"],
+)
+def test_device_spec(spec: DeviceSpec, target: Target) -> None:
     """Validate *all* devices according to their :class:`DeviceSpec`."""
-    target = get_device(spec.name)
-
     # ── Basic identity checks ───────────────────────────────────────────────
     assert isinstance(target, Target)
     assert target.description == spec.name
     assert target.num_qubits == spec.num_qubits
+    present = frozenset(target.operation_names)
 
     # ── Single-qubit operations ──────────────────────────────────────────────
     for gate in spec.single_qubit_gates:
-        _assert_single_qubit_gate_properties(target, gate, vendor=spec.name)
+        _assert_single_qubit_gate_properties(target, gate, present=present, vendor=spec.name)
 
     # ── Two-qubit operations ────────────────────────────────────────────────
-    for gate in spec.two_qubit_gates:
-        _assert_two_qubit_gate_properties(
-            target,
-            gate,
-            symmetric=spec.symmetric_connectivity.get(gate, False),
-            vendor=spec.name,
-        )
+    for gate, symmetric in spec.two_qubit_plan:
+        _assert_two_qubit_gate_properties(target, gate, present=present, symmetric=symmetric, vendor=spec.name)
 
     # ── Measurement ─────────────────────────────────────────────────────────
-    _assert_measure_properties(target, vendor=spec.name)
+    _assert_measure_properties(target, present=present, vendor=spec.name)
 
 
 def test_get_unknown_device() -> None:
@@ -313,6 +393,30 @@ def test_get_device_immutability() -> None:
     assert "dummy_devicename" not in device_names2
 
 
+def test_get_device_update_single_edge() -> None:
+    """Properties shared across edges must be replaced per edge via update_instruction_properties."""
+    device = get_device("iqm_crystal_20")
+    (edge, other_edge, *_) = device["cz"]
+    assert device["cz"][edge] is device["cz"][other_edge]
+
+    device.update_instruction_properties("cz", edge, InstructionProperties(error=0.5))
+    assert device["cz"][edge].error == 0.5
+    assert device["cz"][other_edge].error != 0.5
+    assert get_device("iqm_crystal_20")["cz"][edge].error != 0.5
+
+
+def test_get_target_for_gateset_deterministic() -> None:
+    """Every call returns a fresh Target with the same seeded calibration data."""
+    target = get_target_for_gateset("ibm_falcon", num_qubits=5)
+    target2 = get_target_for_gateset("ibm_falcon", num_qubits=5)
+    assert target is not target2
+
+    for name in target.operation_names:
+        errors = {qargs: props.error for qargs, props in target[name].items() if props is not None}
+        errors2 = {qargs: props.error for qargs, props in target2[name].items() if props is not None}
+        assert errors == errors2, f"error rates of '{name}' differ between calls"
+
+
 def test_get_gateset_immutability() -> None:
     """Changes to a gateset retrieved by get_gateset should not affect the gateset in the registry. Sames for gateset names."""
     gateset = get_gateset("ibm_falcon")